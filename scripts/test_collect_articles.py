@@ -0,0 +1,26 @@
+"""Regression tests for the article digest collector.
+
+Run from the repository root: python -m pytest scripts/
+"""
+
+from scripts.collect_articles import Article, parse_datetime
+
+
+def test_parse_datetime_always_tz_aware():
+    # ISO stamps with an offset parse aware; loose <time> text parses
+    # naive via dateutil and must be coerced so the two stay comparable.
+    iso = parse_datetime("2026-08-10T08:00:00Z")
+    loose = parse_datetime("August 12, 2026")
+    assert iso is not None and iso.tzinfo is not None
+    assert loose is not None and loose.tzinfo is not None
+    assert iso < loose
+
+
+def test_mixed_published_at_sorts_without_typeerror():
+    articles = [
+        Article("a.com", "u-loose", "t", parse_datetime("August 12, 2026"), ""),
+        Article("b.com", "u-iso", "t", parse_datetime("2026-08-10T08:00:00Z"), ""),
+        Article("c.com", "u-none", "t", None, ""),
+    ]
+    articles.sort(key=lambda a: (a.published_at is None, a.published_at, a.site))
+    assert [a.url for a in articles] == ["u-iso", "u-loose", "u-none"]